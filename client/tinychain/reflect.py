@@ -1,18 +1,98 @@
 import inspect
 
 from pydoc import locate
+from weakref import WeakKeyDictionary
 
 from . import error
 from .ref import OpRef
 from .state import Class, Op as OpDef, Scalar, State
-from .util import *
+from .util import Context, URI, form_of, to_json, uri
 
 
-def gen_headers(instance):
-    for name, attr in inspect.getmembers(instance):
-        if name.startswith('_'):
-            continue
+_EMPTY = inspect.Parameter.empty
+
+# bound once so the __call__ paths skip an attribute lookup per OpRef
+
+_OpRefGet = OpRef.Get
+_OpRefPut = OpRef.Put
+_OpRefPost = OpRef.Post
+_OpRefDelete = OpRef.Delete
+
+_SIGNATURE_CACHE = WeakKeyDictionary()
+
+# the value module depends on this one, so its types are resolved lazily, and
+# cached here so the hot __call__ and __form__ paths don't repeat the import
+
+_Nil = None
+_Value = None
+
+
+def _nil():
+    global _Nil
+    if _Nil is None:
+        from .value import Nil
+        _Nil = Nil
+
+    return _Nil
+
+
+def _value():
+    global _Value
+    if _Value is None:
+        from .value import Value
+        _Value = Value
+
+    return _Value
+
+
+def _cached_signature(fn):
+    """Return the :class:`inspect.Signature` of `fn`, computing it at most once."""
+
+    sig = getattr(fn, "__signature__", None)
+    if sig is not None:
+        return sig
+
+    sig = _SIGNATURE_CACHE.get(fn)
+    if sig is None:
+        sig = inspect.signature(fn)
+        _SIGNATURE_CACHE[fn] = sig
+
+    return sig
+
+
+def _fast_params(fn):
+    """Extract the `(name, annotation)` parameter pairs of `fn` without building a `Signature`."""
+
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return [
+            (name, param.annotation)
+            for name, param in _cached_signature(fn).parameters.items()]
+
+    annotations = fn.__annotations__
+    names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+    return [(name, annotations.get(name, _EMPTY)) for name in names]
+
+
+def _fast_signature(fn):
+    """Extract `(parameters, return_annotation)` from `fn` without building a `Signature`."""
+
+    return _fast_params(fn), getattr(fn, "__annotations__", {}).get("return", _EMPTY)
+
+
+def _class_members(cls):
+    """Collect the public class-level attributes of `cls`, without invoking any descriptors."""
 
+    members = {}
+    for klass in reversed(cls.__mro__):
+        members.update(
+            [(name, attr) for name, attr in klass.__dict__.items() if name[:1] != '_'])
+
+    return members
+
+
+def gen_headers(instance):
+    for name, attr in _class_members(type(instance)).items():
         if isinstance(attr, MethodStub):
             setattr(instance, name, attr.method(instance, name))
 
@@ -21,11 +101,15 @@ class Meta(type):
     """The metaclass of a :class:`State`."""
 
     def __form__(cls):
+        form = cls.__dict__.get("__form_cache__")
+        if form is not None:
+            return form
+
         mro = cls.mro()
         if len(mro) < 2:
             raise ValueError("Tinychain class must extend a subclass of State")
 
-        parent_members = dict(inspect.getmembers(mro[1](URI("self"))))
+        parent_members = _class_members(mro[1])
 
         class Header(cls):
             pass
@@ -33,22 +117,26 @@ class Meta(type):
         header = Header(URI("self"))
         instance = cls(URI("self"))
 
-        for name, attr in inspect.getmembers(instance):
-            if name.startswith('_'):
-                continue
+        members = _class_members(cls)
+        members.update(
+            [(name, attr) for name, attr in instance.__dict__.items() if name[:1] != '_'])
+        members = sorted(members.items())
 
+        methods = {}
+        for name, attr in members:
             if isinstance(attr, MethodStub):
-                setattr(header, name, attr.method(instance, name))
+                methods[name] = attr.method(header, name)
+                setattr(header, name, methods[name])
             elif isinstance(attr, State):
                 setattr(header, name, type(attr)(URI(f"self/{name}")))
+            elif inspect.isfunction(attr):
+                pass  # a plain method is inherited by Header and binds to it directly
             else:
                 setattr(header, name, attr)
 
         form = {}
-        for name, attr in inspect.getmembers(instance):
-            if name.startswith('_'):
-                continue
-            elif name in parent_members:
+        for name, attr in members:
+            if name in parent_members:
                 if attr is parent_members[name] or attr == parent_members[name]:
                     continue
                 elif hasattr(attr, "__code__") and hasattr(parent_members[name], "__code__"):
@@ -56,10 +144,11 @@ class Meta(type):
                         continue
 
             if isinstance(attr, MethodStub):
-                form[name] = to_json(attr.method(header, name))
+                form[name] = to_json(methods[name])
             else:
                 form[name] = attr
 
+        type.__setattr__(cls, "__form_cache__", form)
         return form
 
     def __json__(cls):
@@ -72,75 +161,76 @@ class Meta(type):
 
 
 class MethodStub(object):
+    __slots__ = ("dtype", "form", "_parameters", "_rtype")
+
     def __init__(self, dtype, form):
         self.dtype = dtype
         self.form = form
+        self._parameters, self._rtype = _fast_signature(form)
 
     def __call__(self, *args, **kwargs):
         raise RuntimeError(
             "cannot call a MethodStub; use tc.use(<class>) for callable method references")
 
     def method(self, header, name):
-        return self.dtype(header, self.form, name)
+        return self.dtype(header, self.form, name, self._parameters, self._rtype)
 
 
 class Method(object):
+    __slots__ = ("header", "form", "name", "_params", "_rtype", "_endpoint", "_json_cache")
+
     __uri__ = uri(OpDef)
 
-    def __init__(self, header, form, name):
+    def __init__(self, header, form, name, parameters=None, rtype=None):
         self.header = header
         self.form = form
         self.name = name
 
+        if parameters is None:
+            parameters, rtype = _fast_signature(form)
+
+        self._params = parameters
+        self._rtype = rtype
+        self._endpoint = uri(header).append(name)
+        self._json_cache = None
+
     def __json__(self):
-        return {str(uri(self)): to_json(form_of(self))}
+        if self._json_cache is None:
+            self._json_cache = {str(uri(self)): to_json(form_of(self))}
+
+        return self._json_cache
 
     def dtype(self):
         return self.__class__.__name__
 
 
 class GetMethod(Method):
+    __slots__ = ()
+
     __uri__ = uri(OpDef.Get)
 
     def __call__(self, key=None):
-        from .value import Nil
-        rtype = inspect.signature(self.form).return_annotation
-        rtype = resolve_class(self.form, rtype, Nil)
-        return rtype(OpRef.Get(uri(self.header).append(self.name), key))
-
-    def __form__(self):
-        sig = inspect.signature(self.form)
-        parameters = list(sig.parameters.items())
+        rtype = self._rtype
+        if rtype is _EMPTY or not inspect.isclass(rtype):
+            rtype = resolve_class(self.form, rtype, _nil())
+            self._rtype = rtype
 
-        if len(parameters) < 1 or len(parameters) > 3:
-            raise ValueError(f"{self.dtype()} takes 1-3 arguments: (self, cxt, key)")
+        return rtype(_OpRefGet(self._endpoint, key))
 
-        args = [self.header]
-
-        cxt = Context()
-        if len(parameters) > 1:
-            args.append(cxt)
-
-        key_name = "key"
-        if len(parameters) == 3:
-            from .value import Value
-            key_name, param = parameters[2]
-            dtype = resolve_class(self.form, param.annotation, Value)
-            args.append(dtype(URI(key_name)))
-
-        cxt._return = self.form(*args) # populate the Context
-        return (key_name, cxt)
+    def __form__(self):
+        return _get_method_form(self)
 
 
 class PutMethod(Method):
+    __slots__ = ()
+
     __uri__ = uri(OpDef.Put)
 
     def __call__(self, key, value):
-        return OpRef.Put(uri(self.header) + "/" + self.name, key, value)
+        return _OpRefPut(self._endpoint, key, value)
 
     def __form__(self):
-        sig = inspect.signature(self.form)
-        parameters = list(sig.parameters.items())
+        parameters = self._params
 
         if len(parameters) not in [1, 2, 4]:
             raise ValueError("{self.dtype()} has one, two, or four arguments: "
@@ -148,39 +238,49 @@ class PutMethod(Method):
 
         args = [self.header]
 
-        cxt = Context()
+        cxt = None
         if len(parameters) > 1:
+            cxt = Context()
             args.append(cxt)
 
         key_name = "key"
         value_name = "value"
         if len(parameters) == 4:
-            from .value import Value
-            key_name, param = parameters[2]
-            dtype = resolve_class(self.form, param.annotation, Value)
+            key_name, annotation = parameters[2]
+            dtype = resolve_class(self.form, annotation, _value())
             args.append(dtype(URI(key_name)))
 
-            value_name, param = parameters[3]
-            dtype = resolve_class(self.form, param.annotation)
+            value_name, annotation = parameters[3]
+            dtype = resolve_class(self.form, annotation)
             args.append(dtype(URI(value_name)))
 
-        cxt._return = self.form(*args)
+        result = self.form(*args)
+        if cxt is None:
+            cxt = Context()  # still required to carry the op's return value
+
+        cxt._return = result
         return (key_name, value_name, cxt)
 
 
 class PostMethod(Method):
+    __slots__ = ("_kwargs_template",)
+
     __uri__ = uri(OpDef.Post)
 
+    def __init__(self, header, form, name, parameters=None, rtype=None):
+        Method.__init__(self, header, form, name, parameters, rtype)
+        self._kwargs_template = None
+
     def __call__(self, **params):
-        from .value import Nil
+        rtype = self._rtype
+        if rtype is _EMPTY or not inspect.isclass(rtype):
+            rtype = resolve_class(self.form, rtype, _nil())
+            self._rtype = rtype
 
-        rtype = inspect.signature(self.form).return_annotation
-        rtype = resolve_class(self.form, rtype, Nil)
-        return rtype(OpRef.Post(uri(self.header).append(self.name), **params))
+        return rtype(_OpRefPost(self._endpoint, **params))
 
     def __form__(self):
-        sig = inspect.signature(self.form)
-        parameters = list(sig.parameters.items())
+        parameters = self._params
 
         if len(parameters) == 0:
             raise ValueError("{self.dtype()} has at least one argment: "
@@ -188,27 +288,38 @@ class PostMethod(Method):
 
         args = [self.header]
 
-        cxt = Context()
+        cxt = None
         if len(parameters) > 1:
+            cxt = Context()
             args.append(cxt)
 
-        kwargs = {}
-        for name, param in parameters[2:]:
-            dtype = resolve_class(self.form, param.annotation)
-            kwargs[name] = dtype(URI(name))
+        template = self._kwargs_template
+        if template is None:
+            template = [
+                (name, resolve_class(self.form, annotation))
+                for name, annotation in parameters[2:]]
+            self._kwargs_template = template
 
-        cxt._return = self.form(*args, **kwargs)
+        kwargs = {name: dtype(URI(name)) for name, dtype in template}
+
+        result = self.form(*args, **kwargs)
+        if cxt is None:
+            cxt = Context()  # still required to carry the op's return value
+
+        cxt._return = result
         return cxt
 
 
 class DeleteMethod(Method):
+    __slots__ = ()
+
     __uri__ = uri(OpDef.Delete)
 
     def __call__(self, key=None):
-        return OpRef.Delete(uri(self.header).append(self.name), key)
+        return _OpRefDelete(self._endpoint, key)
 
     def __form__(self):
-        return GetMethod.__form__(self)
+        return _get_method_form(self)
 
 
 Method.Get = GetMethod
@@ -218,80 +329,74 @@ Method.Delete = DeleteMethod
 
 
 class Op(object):
+    __slots__ = ("form", "_params", "_json_cache")
+
     __uri__ = uri(OpDef)
 
     def __init__(self, form):
         self.form = form
+        self._params = _fast_params(form)
+        self._json_cache = None
 
     def __json__(self):
-        return {str(uri(self)): to_json(form_of(self))}
+        if self._json_cache is None:
+            self._json_cache = {str(uri(self)): to_json(form_of(self))}
+
+        return self._json_cache
 
     def dtype(self):
         return self.__class__.__name__
 
 
 class GetOp(Op):
+    __slots__ = ()
+
     __uri__ = uri(OpDef.Get)
 
     def __call__(self, key=None):
-        return OpRef.Get(uri(self), key)
+        return _OpRefGet(uri(self), key)
 
     def __form__(self):
-        sig = inspect.signature(self.form)
-        parameters = list(sig.parameters.items())
-
-        if len(parameters) > 2:
-            raise ValueError(f"{self.dtype()} takes 0-2 arguments: (cxt, key)")
-
-        args = []
-
-        cxt = Context()
-        if len(parameters):
-            args.append(cxt)
-
-        key_name = "key"
-        if len(parameters) == 2:
-            from .value import Value
-            key_name, param = parameters[1]
-            dtype = resolve_class(self.form, param.annotation, Value)
-            args.append(dtype(URI(key_name)))
-
-        cxt._return = self.form(*args) # populate the Context
-        return (key_name, cxt)
+        return _get_op_form(self)
 
     def __ref__(self, name):
         return OpDef.Get(URI(name))
 
 
 class PutOp(Op):
+    __slots__ = ()
+
     __uri__ = uri(OpDef.Put)
 
     def __form__(self):
-        sig = inspect.signature(self.form)
-        parameters = list(sig.parameters.items())
+        parameters = self._params
 
         if len(parameters) not in [0, 1, 3]:
             raise ValueError("{self.dtype()} has 0, 1, or 3 arguments: (cxt, key, value)")
 
-        args = [self.header]
+        args = []
 
-        cxt = Context()
+        cxt = None
         if len(parameters):
+            cxt = Context()
             args.append(cxt)
 
         key_name = "key"
         value_name = "value"
         if len(parameters) == 3:
-            from .value import Value
-            key_name, param = parameters[1]
-            dtype = resolve_class(self.form, param.annotation, Value)
+            key_name, annotation = parameters[1]
+            dtype = resolve_class(self.form, annotation, _value())
             args.append(dtype(URI(key_name)))
 
-            value_name, param = parameters[2]
-            dtype = resolve_class(self.form, param.annotation)
+            value_name, annotation = parameters[2]
+            dtype = resolve_class(self.form, annotation)
             args.append(dtype(URI(value_name)))
 
-        cxt._return = self.form(*args)
+        result = self.form(*args)
+        if cxt is None:
+            cxt = Context()  # still required to carry the op's return value
+
+        cxt._return = result
         return (key_name, value_name, cxt)
 
     def __ref__(self, name):
@@ -299,24 +404,30 @@ class PutOp(Op):
 
 
 class PostOp(Op):
+    __slots__ = ()
+
     __uri__ = uri(OpDef.Post)
 
     def __form__(self):
-        sig = inspect.signature(self.form)
-        parameters = list(sig.parameters.items())
+        parameters = self._params
 
         args = []
 
-        cxt = Context()
+        cxt = None
         if len(parameters):
+            cxt = Context()
             args.append(cxt)
 
         kwargs = {}
-        for name, param in parameters[1:]:
-            dtype = resolve_class(self.form, param.annotation)
+        for name, annotation in parameters[1:]:
+            dtype = resolve_class(self.form, annotation)
             kwargs[name] = dtype(URI(name))
 
-        cxt._return = self.form(*args, **kwargs)
+        result = self.form(*args, **kwargs)
+        if cxt is None:
+            cxt = Context()  # still required to carry the op's return value
+
+        cxt._return = result
         return cxt
 
     def __ref__(self, name):
@@ -324,10 +435,12 @@ class PostOp(Op):
 
 
 class DeleteOp(Op):
+    __slots__ = ()
+
     __uri__ = uri(OpDef.Delete)
 
     def __form__(self):
-        return GetOp.__form__(self)
+        return _get_op_form(self)
 
 
     def __ref__(self, name):
@@ -340,8 +453,66 @@ Op.Post = PostOp
 Op.Delete = DeleteOp
 
 
+def _get_method_form(method):
+    """Build the `(key_name, cxt)` form shared by :class:`GetMethod` and :class:`DeleteMethod`."""
+
+    parameters = method._params
+
+    if len(parameters) < 1 or len(parameters) > 3:
+        raise ValueError(f"{method.dtype()} takes 1-3 arguments: (self, cxt, key)")
+
+    args = [method.header]
+
+    cxt = None
+    if len(parameters) > 1:
+        cxt = Context()
+        args.append(cxt)
+
+    key_name = "key"
+    if len(parameters) == 3:
+        key_name, annotation = parameters[2]
+        dtype = resolve_class(method.form, annotation, _value())
+        args.append(dtype(URI(key_name)))
+
+    result = method.form(*args) # populate the Context
+    if cxt is None:
+        cxt = Context()  # still required to carry the op's return value
+
+    cxt._return = result
+    return (key_name, cxt)
+
+
+def _get_op_form(op):
+    """Build the `(key_name, cxt)` form shared by :class:`GetOp` and :class:`DeleteOp`."""
+
+    parameters = op._params
+
+    if len(parameters) > 2:
+        raise ValueError(f"{op.dtype()} takes 0-2 arguments: (cxt, key)")
+
+    args = []
+
+    cxt = None
+    if len(parameters):
+        cxt = Context()
+        args.append(cxt)
+
+    key_name = "key"
+    if len(parameters) == 2:
+        key_name, annotation = parameters[1]
+        dtype = resolve_class(op.form, annotation, _value())
+        args.append(dtype(URI(key_name)))
+
+    result = op.form(*args) # populate the Context
+    if cxt is None:
+        cxt = Context()  # still required to carry the op's return value
+
+    cxt._return = result
+    return (key_name, cxt)
+
+
 def resolve_class(subject, annotation, default=State):
-    if annotation == inspect.Parameter.empty:
+    if annotation is _EMPTY:
         return default
     elif inspect.isclass(annotation):
         return annotation
@@ -90,6 +90,7 @@ class URI(object):
 
         self._root = root
         self._path = path
+        self._str = None
 
     def append(self, name):
         """
@@ -157,6 +158,9 @@ class URI(object):
         return {str(self): []}
 
     def __str__(self):
+        if self._str is not None:
+            return self._str
+
         root = str(self._root)
         if root.startswith('/') or root.startswith('$') or "://" in root:
             pass
@@ -165,9 +169,11 @@ class URI(object):
 
         if self._path:
             path = "/".join(self._path)
-            return f"{root}/{path}"
+            self._str = f"{root}/{path}"
         else:
-            return root
+            self._str = root
+
+        return self._str
 
 
 def uri(subject):